@@ -8,13 +8,21 @@ Monitors a directory for new files and automatically:
 3. Updates the Documents page with new files
 4. Regenerates data JSON files
 5. Generates search-index.json for Fuse.js
+6. Builds thumbnails, PDF previews and video poster frames
 
 Usage:
     python add_files.py --watch /path/to/watch
     python add_files.py --scan /path/to/scan  # One-time scan
+    python add_files.py --scan /mnt/nvme/extracted /mnt/hdd/archive  # Several roots, one record set
+    python add_files.py --scan /path/to/scan --no-thumbs --workers 8
+    python add_files.py serve --port 8000     # Local static server (see static_server.py)
+    python add_files.py daemon --scan /path   # Warm indexer on a Unix socket (see indexer_daemon.py)
+    python add_files.py ctl rescan /path/sub  # Send a job to the daemon
 
 Requirements:
     pip install watchdog
+    pip install Pillow          # optional, for thumbnails
+    poppler-utils / ffmpeg      # optional, for PDF previews / video posters
 """
 
 import os
@@ -22,25 +30,35 @@ import sys
 import json
 import hashlib
 import argparse
+import importlib.util
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
-try:
-    from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
-    WATCHDOG_AVAILABLE = True
-except ImportError:
-    WATCHDOG_AVAILABLE = False
-    print("Warning: watchdog not installed. Run: pip install watchdog")
-    class FileSystemEventHandler: pass
+# Heavy optional dependencies are only imported by the stages that use them,
+# so short CLI invocations and the indexer daemon start fast
+WATCHDOG_AVAILABLE = importlib.util.find_spec("watchdog") is not None
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 
 # Configuration
 DASHBOARD_DIR = Path(__file__).parent
 DATA_DIR = DASHBOARD_DIR / "data"
 DOCS_DIR = DASHBOARD_DIR / "docs"
+THUMBS_DIR = DASHBOARD_DIR / "thumbs"
+EVD_REGISTRY = DATA_DIR / "evd_ids.json"
+OCR_TAGS_FILE = DATA_DIR / "ocr_tags.json"
+
+# Derivative settings (bounding box in px, fallback to JPEG if no WebP codec)
+THUMB_SIZE = (400, 400)
+THUMB_QUALITY = 70
+VIDEO_POSTER_OFFSET = "00:00:01"
 
 # File type categories
 FILE_CATEGORIES = {
@@ -68,7 +86,7 @@ def get_file_hash(filepath: Path) -> str:
         while len(buf) > 0:
             hasher.update(buf)
             buf = f.read(65536)
-    return hasher.hexdigest()[:8]
+    return hasher.hexdigest()
 
 
 def extract_metadata(filepath: Path) -> Dict:
@@ -98,32 +116,114 @@ def format_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
-    """Scan a directory for all files and extract metadata (excluding junk)."""
-    files = []
-    
-    # Exclusion List
-    EXCLUDE_DIRS = {'node_modules', '.git', '__pycache__', 'css', 'js', 'assets', 'fonts', 'webfonts', '.next', '.vercel'}
-    
+# Concurrent readers per device (override with --io-per-device)
+HDD_IO_BUDGET = 2
+SSD_IO_BUDGET = 8
+DEFAULT_IO_BUDGET = 4
+
+# Directories never worth indexing
+EXCLUDE_DIRS = {'node_modules', '.git', '__pycache__', 'css', 'js', 'assets', 'fonts', 'webfonts', '.next', '.vercel'}
+
+
+def get_device_io_budget(device: int) -> int:
+    """Concurrent readers for a block device: few for spinning disks, more for SSD/NVMe."""
+    try:
+        sysfs = Path(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}").resolve()
+        # Partitions have no queue/ of their own; the parent disk does
+        for queue in (sysfs / "queue", sysfs.parent / "queue"):
+            rotational = queue / "rotational"
+            if rotational.exists():
+                return HDD_IO_BUDGET if rotational.read_text().strip() == "1" else SSD_IO_BUDGET
+    except (AttributeError, OSError):
+        pass  # Windows, network shares, overlay filesystems
+    return DEFAULT_IO_BUDGET
+
+
+def _walk_files(directory: Path):
     for root, dirs, filenames in os.walk(directory):
         # Filter directories in-place
         dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-        
         for filename in filenames:
-            filepath = Path(root) / filename
-             # Only process known data types to be safe
-            if filepath.suffix.lower() not in ['.json', '.py', '.md', '.html', '.css', '.js', '.txt']:
-                 # Generally we want all files, but for 'archive' we specifically want media/docs
-                 # Actually, let's just skip known code files if verify pure data
-                 pass
-
-            try:
-                metadata = extract_metadata(filepath)
-                files.append(metadata)
-            except Exception as e:
-                # print(f"Error processing {filepath}: {e}")
-                pass
-    
-    return files
+            yield Path(root) / filename
+
+
+def _extract_cached(filepath: Path, cache: Optional[Dict[str, Dict]]) -> Optional[tuple]:
+    """(metadata, bytes_read) for one file, reusing cache entries whose size/mtime match."""
+    try:
+        cached = cache.get(str(filepath)) if cache else None
+        if cached:
+            stat = filepath.stat()
+            if (cached["size_bytes"] == stat.st_size and
+                    cached["modified"] == datetime.fromtimestamp(stat.st_mtime).isoformat()):
+                return cached, 0
+        metadata = extract_metadata(filepath)
+        return metadata, (metadata["size_bytes"] if metadata["hash"] != "large_file" else 0)
+    except Exception:
+        return None
+
+
+def _scan_device(roots: List[Path], budget: int, cache: Optional[Dict[str, Dict]]) -> tuple:
+    """Scan one device's roots through its own reader pool, timing each root."""
+    files, report = [], []
+    with ThreadPoolExecutor(max_workers=budget) as pool:
+        for root in roots:
+            started = time.perf_counter()
+            results = [r for r in pool.map(lambda p: _extract_cached(p, cache), _walk_files(root)) if r]
+            elapsed = time.perf_counter() - started
+            read = sum(n for _, n in results)
+            files.extend(m for m, _ in results)
+            report.append({
+                "root": str(root),
+                "files": len(results),
+                "bytes_read": read,
+                "seconds": round(elapsed, 3),
+                "mb_per_second": round(read / elapsed / 1_000_000, 1) if elapsed else 0.0,
+                "files_per_second": round(len(results) / elapsed, 1) if elapsed else 0.0,
+                "readers": budget,
+            })
+    return files, report
+
+
+def scan_roots(roots: List[Path], cache: Optional[Dict[str, Dict]] = None,
+               io_budget: Optional[int] = None, quiet: bool = False) -> List[Dict]:
+    """Scan several roots concurrently, one reader pool per underlying device.
+
+    A slow HDD then only limits its own roots instead of starving an NVMe
+    volume. Nested or repeated roots are collapsed and results are merged
+    in path order so EVD ids and outputs don't depend on completion order.
+
+    Roots are made absolute but symlinks are not resolved: get_path_info
+    derives collections and S3 keys from the path as mounted, and only
+    the device grouping looks through the link (stat follows it).
+    """
+    absolute = sorted({Path(os.path.abspath(r)) for r in roots})
+    roots = [r for r in absolute if not any(p in r.parents for p in absolute)]
+
+    by_device = {}
+    for root in roots:
+        by_device.setdefault(root.stat().st_dev, []).append(root)
+
+    files, report = [], []
+    with ThreadPoolExecutor(max_workers=len(by_device) or 1) as devices:
+        futures = [
+            devices.submit(_scan_device, dev_roots, io_budget or get_device_io_budget(dev), cache)
+            for dev, dev_roots in by_device.items()
+        ]
+        for future in futures:
+            dev_files, dev_report = future.result()
+            files.extend(dev_files)
+            report.extend(dev_report)
+
+    if not quiet:
+        for r in report:
+            print(f"  {r['root']}: {r['files']} files, {format_size(r['bytes_read'])} read in {r['seconds']}s "
+                  f"({r['mb_per_second']} MB/s, {r['files_per_second']} files/s, {r['readers']} readers)")
+    return sorted(files, key=lambda f: f["path"])
+
+
+def scan_directory(directory: Path, cache: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+    """Scan a directory for all files and extract metadata (excluding junk)."""
+    return scan_roots([directory], cache, quiet=True)
 
 
 def update_documents_data(files: List[Dict]) -> None:
@@ -231,6 +331,22 @@ def get_path_info(abs_path: str) -> tuple:
     s3_url = f"https://epstein-archive-media.s3.us-east-1.amazonaws.com/archive/{quote(rel_path.replace(os.sep, '/'), safe='/')}"
     return rel_path, collection, s3_url
 
+
+def merge_duplicate_keys(files: List[Dict]) -> List[Dict]:
+    """Keep one file per S3 key; the first by path wins so ids stay stable.
+
+    The same relative file under two mounted roots maps to one S3 object,
+    so only one record (and one EVD id) may claim it.
+    """
+    winners = {}
+    for f in sorted(files, key=lambda f: f["path"]):
+        s3_url = get_path_info(f["path"])[2]
+        if s3_url in winners:
+            print(f"Warning: {f['path']} duplicates {winners[s3_url]['path']} (same S3 key), skipped")
+            continue
+        winners[s3_url] = f
+    return list(winners.values())
+
 # Enhanced Keyword Map for Forced Tagging
 KEYWORD_MAP = {
     "epstein": ["epstein", "jeffrey", "island", "pedophile"],
@@ -307,7 +423,7 @@ def get_semantic_tags(filename, collection):
     if "deposition" in lower_name or "transcript" in lower_name:
         tags.add("testimony")
 
-    return list(tags)
+    return sorted(tags)
 
 
 def get_source_category(collection: str, filename: str) -> str:
@@ -334,7 +450,7 @@ def generate_search_index(files: List[Dict]) -> None:
     search_index = []
     for f in files:
         rel_path, collection, s3_url = get_path_info(f["path"])
-        tags = get_semantic_tags(f["filename"], f["path"])
+        tags = sorted(set(get_semantic_tags(f["filename"], f["path"])) | set(f.get("ocr_tags", [])))
         
         search_index.append({
             "name": f["filename"],
@@ -357,13 +473,16 @@ def generate_manifest(files: List[Dict]) -> None:
     for f in files:
         rel_path, collection, s3_url = get_path_info(f["path"])
         
-        manifest.append({
+        entry = {
             "filename": f["filename"],
             "relative_path": s3_url,
             "collection_name": collection,
             "file_type": f["category"],
             "last_modified": f["modified"]
-        })
+        }
+        if f.get("thumbnail"):
+            entry["thumbnail"] = f["thumbnail"]
+        manifest.append(entry)
         
     output_path = DASHBOARD_DIR / "manifest.json"
     with open(output_path, 'w') as f:
@@ -372,17 +491,53 @@ def generate_manifest(files: List[Dict]) -> None:
     print(f"Generated Production Manifest: {output_path}")
 
 
-def generate_master_archive(files: List[Dict]) -> None:
+def load_evd_registry() -> Dict[str, str]:
+    """S3 path -> EVD id for every record ever published.
+
+    Seeded from an existing master_archive.json on first use so ids that
+    were already published keep their numbers.
+    """
+    if EVD_REGISTRY.exists():
+        with open(EVD_REGISTRY, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    registry = {}
+    legacy = DATA_DIR / "master_archive.json"
+    if legacy.exists():
+        with open(legacy, 'r', encoding='utf-8') as f:
+            for record in json.load(f).get("records", []):
+                registry[record["path"]] = record["id"]
+    return registry
+
+
+def assign_evd_id(registry: Dict[str, str], next_number: Dict[str, int], s3_url: str, collection: str) -> str:
+    """Stable id for a file: reuse its registered id, else the next free number for its prefix."""
+    if s3_url not in registry:
+        prefix = f"EVD-{collection[:3].upper()}"
+        registry[s3_url] = f"{prefix}-{str(next_number.get(prefix, 0)).zfill(4)}"
+        next_number[prefix] = next_number.get(prefix, 0) + 1
+    return registry[s3_url]
+
+
+def generate_master_archive(files: List[Dict]) -> List[Dict]:
     """Generate master_archive.json for Archive.js (Evidence Tracker)."""
     records = []
+
+    # Ids come from a persistent registry so they don't shift when files are
+    # added, removed or scanned from a different set of roots
+    registry = load_evd_registry()
+    next_number = {}
+    for evd_id in registry.values():
+        prefix, _, number = evd_id.rpartition("-")
+        if number.isdigit():
+            next_number[prefix] = max(next_number.get(prefix, 0), int(number) + 1)
     
-    for i, f in enumerate(files):
+    for f in files:
         rel_path, collection, s3_url = get_path_info(f["path"])
-        tags = get_semantic_tags(f["filename"], f["path"])
+        tags = sorted(set(get_semantic_tags(f["filename"], f["path"])) | set(f.get("ocr_tags", [])))
         source = get_source_category(collection, f["filename"])
         
-        records.append({
-            "id": f"EVD-{collection[:3].upper()}-{str(i).zfill(4)}",
+        record = {
+            "id": assign_evd_id(registry, next_number, s3_url, collection),
             "name": f["filename"],
             "path": s3_url,
             "collection": collection,
@@ -391,25 +546,273 @@ def generate_master_archive(files: List[Dict]) -> None:
             "description": f"Recovered from {collection}",
             "source": source,
             "tags": tags
-        })
+        }
+        if f.get("thumbnail"):
+            record["thumbnail"] = f["thumbnail"]
+        records.append(record)
         
     output_path = DATA_DIR / "master_archive.json"
     with open(output_path, 'w') as f:
         json.dump({"records": records}, f)
-    with open(output_path, 'w') as f:
-        json.dump({"records": records}, f)
+    with open(EVD_REGISTRY, 'w') as f:
+        json.dump(registry, f)
         
     print(f"Generated Master Archive: {output_path}")
+    return records
+
+
+def generate_network_cooccurrence(records: List[Dict]) -> None:
+    """Refresh evidence-backed connections in networks.json from archive tags."""
+    import build_network
+    if not build_network.SCIPY_AVAILABLE:
+        print("Warning: numpy/scipy not installed, skipping co-occurrence network")
+        return
+    build_network.update_networks(records, DATA_DIR / "networks.json")
 
 
+def generate_person_postings(records: List[Dict]) -> None:
+    """Write per-person posting files for the Persons page."""
+    import build_postings
+    with open(DATA_DIR / "persons.json", 'r', encoding='utf-8') as f:
+        persons = json.load(f)
+    build_postings.generate_postings(records, persons, DATA_DIR / "persons")
 
-class NewFileHandler(FileSystemEventHandler):
+
+def generate_release() -> None:
+    """Version the outputs and write a delta against the previous build."""
+    import releases
+    releases.publish_release(DASHBOARD_DIR)
+
+
+# -----------------------------------------------------------------------------
+# Derivatives (thumbnails, PDF previews, video poster frames)
+# -----------------------------------------------------------------------------
+
+def get_content_key(f: Dict) -> str:
+    """Content key for a file's derivatives so each one is built only once.
+
+    Reuses the full MD5 extract_metadata already computed; only files too
+    large to hash get a sampled key.
+    """
+    if f["hash"] != "large_file":
+        return f["hash"]
+    hasher = hashlib.sha1()
+    with open(f["path"], 'rb') as fh:
+        # Size + head + tail is enough to identify multi-GB videos
+        hasher.update(str(f["size_bytes"]).encode())
+        hasher.update(fh.read(1 << 20))
+        fh.seek(-(1 << 20), os.SEEK_END)
+        hasher.update(fh.read(1 << 20))
+    return hasher.hexdigest()
+
+
+def get_derivative_kind(f: Dict) -> Optional[str]:
+    """Which derivative (if any) a scanned file gets."""
+    if f["category"] in ("image", "video"):
+        return f["category"]
+    if f["extension"] == ".pdf":
+        return "pdf"
+    return None
+
+
+def _save_thumbnail(image, dest: Path) -> None:
+    """Downscale and write atomically so a killed worker never leaves a partial file."""
+    image.thumbnail(THUMB_SIZE)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    tmp = dest.with_name(dest.name + ".tmp")
+    image.save(tmp, "WEBP" if dest.suffix == ".webp" else "JPEG", quality=THUMB_QUALITY)
+    os.replace(tmp, dest)
+
+
+def _render_image_thumbnail(src: Path, dest: Path) -> None:
+    from PIL import Image
+    with Image.open(src) as image:
+        image.draft("RGB", THUMB_SIZE)  # JPEG decoder downscales while decoding
+        _save_thumbnail(image, dest)
+
+
+def _render_pdf_preview(src: Path, dest: Path) -> None:
+    from PIL import Image
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "page"
+        subprocess.run(
+            ["pdftoppm", "-f", "1", "-l", "1", "-singlefile", "-jpeg",
+             "-scale-to", str(max(THUMB_SIZE)), str(src), str(base)],
+            check=True, capture_output=True, timeout=120
+        )
+        with Image.open(base.with_suffix(".jpg")) as image:
+            _save_thumbnail(image, dest)
+
+
+def _render_video_poster(src: Path, dest: Path) -> None:
+    from PIL import Image
+    with tempfile.TemporaryDirectory() as tmp:
+        frame = Path(tmp) / "poster.jpg"
+        # Seek past black lead-in frames; clips shorter than that use frame 0
+        for offset in (VIDEO_POSTER_OFFSET, "0"):
+            subprocess.run(
+                ["ffmpeg", "-v", "error", "-y", "-ss", offset, "-i", str(src),
+                 "-frames:v", "1", "-vf", f"scale={max(THUMB_SIZE)}:-2", str(frame)],
+                check=True, capture_output=True, timeout=300
+            )
+            if frame.exists():
+                break
+        with Image.open(frame) as image:
+            _save_thumbnail(image, dest)
+
+
+DERIVATIVE_RENDERERS = {
+    "image": _render_image_thumbnail,
+    "pdf": _render_pdf_preview,
+    "video": _render_video_poster,
+}
+
+
+def build_derivative(path: str, kind: str, dest: str) -> bool:
+    """Worker entry point: render one derivative, returning whether it succeeded."""
+    try:
+        DERIVATIVE_RENDERERS[kind](Path(path), Path(dest))
+        return True
+    except Exception:
+        return False
+
+
+def find_existing_derivative(key: str) -> Optional[Path]:
+    for ext in (".webp", ".jpg"):
+        candidate = THUMBS_DIR / f"{key}{ext}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def generate_derivatives(files: List[Dict], workers: Optional[int] = None, build: bool = True) -> None:
+    """Build thumbnails/previews/posters in a worker pool and attach them to file records.
+
+    Derivatives already on disk are attached without reading the source
+    again; with build=False nothing new is rendered, so skipping the stage
+    doesn't drop existing thumbnails from the outputs.
+    """
+    if build and not PIL_AVAILABLE:
+        print("Warning: Pillow not installed, skipping thumbnails. Run: pip install Pillow")
+        build = False
+
+    renderable = {"image"}
+    if shutil.which("pdftoppm"):
+        renderable.add("pdf")
+    elif build:
+        print("Warning: pdftoppm not found, skipping PDF previews (install poppler-utils)")
+    if shutil.which("ffmpeg"):
+        renderable.add("video")
+    elif build:
+        print("Warning: ffmpeg not found, skipping video poster frames")
+
+    jobs = []
+    existing = 0
+    for f in files:
+        kind = get_derivative_kind(f)
+        if kind is None:
+            continue
+        try:
+            key = get_content_key(f)
+        except OSError:
+            continue
+        found = find_existing_derivative(key)
+        if found:
+            f["thumbnail"] = found.relative_to(DASHBOARD_DIR).as_posix()
+            existing += 1
+        elif build and kind in renderable:
+            jobs.append((f, kind, key))
+    if not jobs:
+        if existing:
+            print(f"Derivatives: {existing} already built in {THUMBS_DIR}")
+        return
+
+    from PIL import features as pil_features
+    THUMBS_DIR.mkdir(exist_ok=True)
+    ext = ".webp" if pil_features.check("webp") else ".jpg"
+    dests = [THUMBS_DIR / f"{key}{ext}" for _, _, key in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            build_derivative,
+            [f["path"] for f, _, _ in jobs],
+            [kind for _, kind, _ in jobs],
+            [str(dest) for dest in dests],
+            chunksize=16
+        )
+        built = 0
+        for (f, _, _), dest, ok in zip(jobs, dests, results):
+            if ok:
+                f["thumbnail"] = dest.relative_to(DASHBOARD_DIR).as_posix()
+                built += 1
+
+    print(f"Derivatives: {built}/{len(jobs)} built, {existing} already built in {THUMBS_DIR}")
+
+
+def load_ocr_tags() -> Dict[str, List[str]]:
+    """S3 path -> person tags found by OCR (ocr_tagger.py / daemon retag)."""
+    if not OCR_TAGS_FILE.exists():
+        return {}
+    with open(OCR_TAGS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_ocr_tags(updates: Dict[str, List[str]]) -> None:
+    """Merge OCR results into the sidecar so rebuilds from a scan keep them."""
+    ocr_tags = load_ocr_tags()
+    ocr_tags.update(updates)
+    DATA_DIR.mkdir(exist_ok=True)
+    with open(OCR_TAGS_FILE, 'w') as f:
+        json.dump(ocr_tags, f)
+
+
+def attach_ocr_tags(files: List[Dict]) -> None:
+    """Carry persisted OCR tags onto freshly scanned file records."""
+    ocr_tags = load_ocr_tags()
+    if not ocr_tags:
+        return
+    for f in files:
+        if "ocr_tags" not in f:
+            tags = ocr_tags.get(get_path_info(f["path"])[2])
+            if tags:
+                f["ocr_tags"] = tags
+
+
+def prepare_files(files: List[Dict], thumbs: bool = True, workers: Optional[int] = None) -> List[Dict]:
+    """Shared preparation before any output is written: one record per S3 key,
+    persisted OCR tags and thumbnails attached (built only if thumbs)."""
+    files = merge_duplicate_keys(files)
+    attach_ocr_tags(files)
+    generate_derivatives(files, workers, build=thumbs)
+    return files
+
+
+def write_outputs(files: List[Dict], thumbs: bool = True, workers: Optional[int] = None) -> None:
+    """Run every output stage for a scanned file set."""
+    files = prepare_files(files, thumbs, workers)
+    update_documents_data(files)
+    update_timeline_data(files)
+    generate_search_index(files)
+    generate_manifest(files)
+    records = generate_master_archive(files)
+    generate_network_cooccurrence(records)
+    generate_person_postings(records)
+    generate_release()
+
+
+class NewFileHandler:
     """Handler for new file events."""
     
-    def __init__(self, base_dir: Path):
-        self.base_dir = base_dir
+    def __init__(self, roots: List[Path]):
+        self.roots = roots
         self.processed = set()
     
+    def dispatch(self, event):
+        # Duck-typed watchdog handler so watchdog is only imported when watching
+        if event.event_type == "created":
+            self.on_created(event)
+    
     def on_created(self, event):
         if event.is_directory:
             return
@@ -427,7 +830,7 @@ class NewFileHandler(FileSystemEventHandler):
             print(f"  Size: {metadata['size_human']}")
             
             # Update data files
-            all_files = scan_directory(self.base_dir)
+            all_files = prepare_files(scan_roots(self.roots))
             update_documents_data(all_files)
             update_timeline_data(all_files)
             generate_search_index(all_files)
@@ -437,23 +840,24 @@ class NewFileHandler(FileSystemEventHandler):
             print(f"  Error: {e}")
 
 
-def watch_directory(directory: Path) -> None:
-    """Watch a directory for new files."""
+def watch_directory(roots: List[Path]) -> None:
+    """Watch one or more directories for new files."""
     if not WATCHDOG_AVAILABLE:
         print("Error: watchdog library required. Install with: pip install watchdog")
         sys.exit(1)
     
-    print(f"Watching directory: {directory}")
+    print(f"Watching directories: {', '.join(str(r) for r in roots)}")
     print("Press Ctrl+C to stop...")
     
-    event_handler = NewFileHandler(directory)
+    from watchdog.observers import Observer
+    event_handler = NewFileHandler(roots)
     observer = Observer()
-    observer.schedule(event_handler, str(directory), recursive=True)
+    for root in roots:
+        observer.schedule(event_handler, str(root), recursive=True)
     observer.start()
     
     try:
         while True:
-            import time
             time.sleep(1)
     except KeyboardInterrupt:
         observer.stop()
@@ -463,23 +867,58 @@ def watch_directory(directory: Path) -> None:
 
 def main():
     parser = argparse.ArgumentParser(description="Epstein Files Auto-Updater")
-    parser.add_argument("--watch", type=Path, help="Watch directory for new files")
-    parser.add_argument("--scan", type=Path, help="One-time scan of directory")
+    parser.add_argument("command", nargs="?", choices=["serve", "daemon", "ctl"],
+                        help="serve: local static server; daemon: warm indexer; ctl: send a job to the daemon")
+    parser.add_argument("job", nargs="*", help="ctl: job name (rescan/retag/reindex/flush/stats/shutdown) and optional path")
+    parser.add_argument("--watch", type=Path, nargs="+", help="Watch directories for new files")
+    parser.add_argument("--scan", type=Path, nargs="+", help="One-time scan of one or more directories")
+    parser.add_argument("--io-per-device", type=int, default=None,
+                        help="Concurrent readers per storage device (default: 2 for HDD, 8 for SSD)")
     parser.add_argument("--output", type=Path, default=DATA_DIR, help="Output directory for JSON")
+    parser.add_argument("--no-thumbs", action="store_true", help="Skip thumbnail/preview generation")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for derivatives")
+    parser.add_argument("--root", type=Path, default=DASHBOARD_DIR, help="Directory to serve")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to serve on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to serve on")
+    parser.add_argument("--precompress", action="store_true", help="Write .gz/.br sidecars before serving")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument("--socket", type=Path, default=None, help="Indexer daemon socket path")
+    parser.add_argument("--live", action="store_true", help="daemon: apply filesystem events as they happen")
     
     args = parser.parse_args()
     
-    if args.watch:
+    for root in (args.scan or []) + (args.watch or []):
+        if not root.is_dir():
+            parser.error(f"not a directory: {root}")
+    
+    if args.command == "serve":
+        import static_server
+        if args.precompress:
+            static_server.precompress(args.root)
+        static_server.serve(args.root, args.host, args.port, args.verbose)
+    elif args.command == "daemon":
+        import indexer_daemon
+        if not args.scan:
+            parser.error("daemon requires --scan DIR")
+        indexer_daemon.run_daemon(args.scan, args.socket or indexer_daemon.SOCKET_PATH,
+                                  args.live, args.workers, args.io_per_device)
+    elif args.command == "ctl":
+        import indexer_daemon
+        if not args.job:
+            parser.error("ctl requires a job name")
+        job = {"cmd": args.job[0]}
+        if len(args.job) > 1:
+            job["path"] = os.path.abspath(args.job[1])
+        if args.no_thumbs:
+            job["thumbs"] = False
+        print(json.dumps(indexer_daemon.send_job(job, args.socket or indexer_daemon.SOCKET_PATH), indent=2))
+    elif args.watch:
         watch_directory(args.watch)
     elif args.scan:
-        print(f"Scanning {args.scan}...")
-        files = scan_directory(args.scan)
+        print(f"Scanning {', '.join(str(r) for r in args.scan)}...")
+        files = scan_roots(args.scan, io_budget=args.io_per_device)
         print(f"Found {len(files)} files")
-        update_documents_data(files)
-        update_timeline_data(files)
-        generate_search_index(files)
-        generate_manifest(files)
-        generate_master_archive(files)
+        write_outputs(files, thumbs=not args.no_thumbs, workers=args.workers)
         print("Done!")
     else:
         parser.print_help()
@@ -0,0 +1,201 @@
+"""
+Person Co-occurrence Network Builder
+
+Derives evidence-backed connections between key figures from the person
+tags in master_archive.json and writes them into networks.json.
+
+The archive is turned into a sparse document x person incidence matrix X;
+X.T @ X then gives every pairwise co-occurrence count in one sparse product,
+so millions of documents are processed in seconds. Each figure keeps only
+its top-K partners to keep networks.json small.
+
+Usage:
+    python build_network.py
+    python build_network.py --top-k 8 --min-count 3 --evidence 5
+
+Requirements:
+    pip install numpy scipy
+"""
+
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Paths
+DATA_DIR = Path(__file__).parent / "data"
+MASTER_FILE = DATA_DIR / "master_archive.json"
+NETWORKS_FILE = DATA_DIR / "networks.json"
+
+# Archive tags that don't match a networks.json figure id verbatim
+PERSON_TAG_ALIASES = {
+    "prince": "prince_andrew",
+    "les": "wexner",
+}
+
+# Pruning defaults
+TOP_K = 10
+MIN_COUNT = 2
+MAX_EVIDENCE = 10
+
+# cooccurrence_meta fields that differ on every run
+VOLATILE_META = {"generated", "elapsed_seconds"}
+
+
+def build_incidence(records: List[Dict], person_ids: List[str]) -> "sparse.csc_matrix":
+    """Binary document x person matrix from record tags (CSC for column slicing)."""
+    column = {pid: j for j, pid in enumerate(person_ids)}
+    for tag, pid in PERSON_TAG_ALIASES.items():
+        if pid in column:
+            column[tag] = column[pid]
+
+    rows, cols = [], []
+    for i, record in enumerate(records):
+        for tag in record.get("tags", []):
+            j = column.get(tag)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+
+    X = sparse.csc_matrix(
+        (np.ones(len(rows), dtype=np.int32), (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64))),
+        shape=(len(records), len(person_ids))
+    )
+    # Alias + canonical tag on the same record would otherwise count twice
+    X.data[:] = 1
+    return X
+
+
+def compute_edges(X: "sparse.csc_matrix", top_k: int = TOP_K, min_count: int = MIN_COUNT) -> Dict[str, "np.ndarray"]:
+    """Co-occurrence counts and PMI/Jaccard weights, pruned to top-K per person.
+
+    Returns directed edge arrays (src, dst, count, pmi, jaccard) sorted by
+    src then descending count, so each figure's partners are contiguous.
+    """
+    n_docs = X.shape[0]
+    C = (X.T @ X).tocoo()
+    df = np.asarray(X.sum(axis=0)).ravel().astype(np.float64)
+
+    keep = (C.row != C.col) & (C.data >= min_count)
+    src, dst, count = C.row[keep], C.col[keep], C.data[keep].astype(np.float64)
+
+    pmi = np.log(count * n_docs / (df[src] * df[dst]))
+    jaccard = count / (df[src] + df[dst] - count)
+
+    # Sort by (src asc, count desc, jaccard desc) and keep the first K of each group
+    order = np.lexsort((-jaccard, -count, src))
+    src, dst, count, pmi, jaccard = src[order], dst[order], count[order], pmi[order], jaccard[order]
+    if len(src):
+        starts = np.flatnonzero(np.r_[True, src[1:] != src[:-1]])
+        sizes = np.diff(np.r_[starts, len(src)])
+        rank = np.arange(len(src)) - np.repeat(starts, sizes)
+        top = rank < top_k
+        src, dst, count, pmi, jaccard = src[top], dst[top], count[top], pmi[top], jaccard[top]
+
+    return {"src": src, "dst": dst, "count": count.astype(np.int64), "pmi": pmi, "jaccard": jaccard}
+
+
+def collect_evidence(X: "sparse.csc_matrix", src: "np.ndarray", dst: "np.ndarray",
+                     doc_ids: List[str], limit: int = MAX_EVIDENCE) -> List[List[str]]:
+    """Document ids shared by each edge's endpoints (first `limit`)."""
+    evidence = []
+    for i, j in zip(src, dst):
+        a = X.indices[X.indptr[i]:X.indptr[i + 1]]
+        b = X.indices[X.indptr[j]:X.indptr[j + 1]]
+        shared = np.intersect1d(a, b, assume_unique=True)[:limit]
+        evidence.append([doc_ids[d] for d in shared])
+    return evidence
+
+
+def build_cooccurrence(records: List[Dict], person_ids: List[str], top_k: int = TOP_K,
+                       min_count: int = MIN_COUNT, max_evidence: int = MAX_EVIDENCE) -> Tuple[Dict[str, List[Dict]], Dict]:
+    """Per-figure co-occurrence lists plus summary stats for networks.json."""
+    started = time.perf_counter()
+    X = build_incidence(records, person_ids)
+    X.sort_indices()
+    edges = compute_edges(X, top_k, min_count)
+    doc_ids = [r.get("id", str(i)) for i, r in enumerate(records)]
+    evidence = collect_evidence(X, edges["src"], edges["dst"], doc_ids, max_evidence)
+
+    by_person = {pid: [] for pid in person_ids}
+    for k in range(len(edges["src"])):
+        by_person[person_ids[edges["src"][k]]].append({
+            "id": person_ids[edges["dst"][k]],
+            "count": int(edges["count"][k]),
+            "pmi": round(float(edges["pmi"][k]), 4),
+            "jaccard": round(float(edges["jaccard"][k]), 4),
+            "evidence": evidence[k]
+        })
+
+    stats = {
+        "documents": X.shape[0],
+        "tagged_documents": int(np.count_nonzero(np.diff(X.tocsr().indptr))),
+        "edges": len(edges["src"]),
+        "top_k": top_k,
+        "min_count": min_count,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "generated": datetime.now().isoformat()
+    }
+    return by_person, stats
+
+
+def update_networks(records: List[Dict], networks_file: Path = NETWORKS_FILE, **options) -> Dict:
+    """Write computed co-occurrence into networks.json, leaving hand-curated fields intact."""
+    with open(networks_file, 'r', encoding='utf-8') as f:
+        network = json.load(f)
+
+    figures = network.get("key_figures", [])
+    by_person, stats = build_cooccurrence(records, [fig["id"] for fig in figures], **options)
+
+    # networks.json is tracked; don't rewrite it just to refresh timestamps
+    previous_meta = network.get("cooccurrence_meta", {})
+    if (all(fig.get("cooccurrence") == by_person[fig["id"]] for fig in figures) and
+            all(previous_meta.get(k) == v for k, v in stats.items() if k not in VOLATILE_META)):
+        print(f"{networks_file} unchanged: {stats['edges']} co-occurrence edges")
+        return stats
+
+    for fig in figures:
+        fig["cooccurrence"] = by_person[fig["id"]]
+    network["cooccurrence_meta"] = stats
+
+    with open(networks_file, 'w', encoding='utf-8') as f:
+        json.dump(network, f, indent=4, ensure_ascii=False)
+
+    print(f"Updated {networks_file}: {stats['edges']} co-occurrence edges "
+          f"from {stats['documents']} documents in {stats['elapsed_seconds']}s")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build person co-occurrence network from archive tags")
+    parser.add_argument("--archive", type=Path, default=MASTER_FILE, help="master_archive.json to read")
+    parser.add_argument("--networks", type=Path, default=NETWORKS_FILE, help="networks.json to update")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="Partners kept per figure")
+    parser.add_argument("--min-count", type=int, default=MIN_COUNT, help="Minimum shared documents per edge")
+    parser.add_argument("--evidence", type=int, default=MAX_EVIDENCE, help="Document ids kept per edge")
+    args = parser.parse_args()
+
+    if not SCIPY_AVAILABLE:
+        print("Error: numpy and scipy required. Install with: pip install numpy scipy")
+        raise SystemExit(1)
+
+    print("Loading master archive...")
+    with open(args.archive, 'r', encoding='utf-8') as f:
+        records = json.load(f).get("records", [])
+    print(f"Total records: {len(records)}")
+
+    update_networks(records, args.networks, top_k=args.top_k,
+                    min_count=args.min_count, max_evidence=args.evidence)
+
+
+if __name__ == "__main__":
+    main()
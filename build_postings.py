@@ -0,0 +1,163 @@
+"""
+Per-Person Document Postings
+
+Builds one small posting file per person in persons.json so the Persons
+page can show a person's documents without downloading the whole master
+archive. Records are matched to people through their archive tags, which
+include filename keywords and, once ocr_tagger.py or the daemon's retag
+job has run, OCR hits (persisted in data/ocr_tags.json and merged back in
+by add_files.write_outputs).
+
+Output:
+    data/persons/index.json     name -> {slug, count}
+    data/persons/<slug>.json    EVD ids, counts by collection/type, top documents
+
+Usage:
+    python build_postings.py
+    python build_postings.py --top 50
+"""
+
+import re
+import json
+import argparse
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# Paths
+DATA_DIR = Path(__file__).parent / "data"
+MASTER_FILE = DATA_DIR / "master_archive.json"
+PERSONS_FILE = DATA_DIR / "persons.json"
+POSTINGS_DIR = DATA_DIR / "persons"
+
+# Alias table: persons.json name -> archive tags that identify them
+PERSON_ALIASES = {
+    "Ghislaine Maxwell": ["maxwell"],
+    "Prince Andrew": ["prince"],
+    "Duke of York": ["prince"],
+    "Bill Clinton": ["clinton"],
+    "Donald Trump": ["trump"],
+    "Alan Dershowitz": ["dershowitz"],
+    "Les Wexner": ["les", "wexner"],
+    "Jean-Luc Brunel": ["brunel"],
+    "Virginia Giuffre": ["giuffre"],
+    "Kevin Spacey": ["spacey"],
+    "Bill Richardson": ["richardson"],
+    "Eva Dubin": ["dubin"],
+    "Glenn Dubin": ["dubin"],
+}
+
+# Documents listed in full per posting file (all ids are always included)
+TOP_DOCUMENTS = 25
+
+
+def canonical_name(name: str) -> str:
+    """Contact book 'Last, First' -> 'First Last' so both lists share one posting."""
+    if "," in name:
+        last, first = [part.strip() for part in name.split(",", 1)]
+        return f"{first} {last}"
+    return name.strip()
+
+
+def slugify(name: str) -> str:
+    """URL/file-safe slug, e.g. 'Jean-Luc Brunel' -> 'jean-luc-brunel'."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-")
+
+
+def build_tag_index(records: List[Dict]) -> Dict[str, List[int]]:
+    """Inverted index: tag -> ascending record positions."""
+    index = {}
+    for i, record in enumerate(records):
+        for tag in set(record.get("tags", [])):
+            index.setdefault(tag, []).append(i)
+    return index
+
+
+def get_person_names(persons: Dict) -> List[str]:
+    """Unique canonical names across key_persons and contact_book_names."""
+    names = [p["name"] for p in persons.get("key_persons", [])]
+    names += [canonical_name(n) for n in persons.get("contact_book_names", [])]
+    return list(dict.fromkeys(names))
+
+
+def build_posting(name: str, positions: List[int], records: List[Dict],
+                  person_tags: set, top: int = TOP_DOCUMENTS) -> Dict:
+    """Posting for one person: ids, facet counts and the most specific documents."""
+    matched = [records[i] for i in positions]
+
+    # Documents naming fewer people are more about this person; newest first within that
+    ranked = sorted(matched, key=lambda r: r.get("date", ""), reverse=True)
+    ranked.sort(key=lambda r: len(person_tags.intersection(r.get("tags", []))))
+
+    top_documents = []
+    for r in ranked[:top]:
+        doc = {key: r[key] for key in ("id", "name", "path", "type", "collection", "date") if key in r}
+        if r.get("thumbnail"):
+            doc["thumbnail"] = r["thumbnail"]
+        top_documents.append(doc)
+
+    return {
+        "name": name,
+        "slug": slugify(name),
+        "tags": PERSON_ALIASES.get(name, []),
+        "count": len(matched),
+        "by_collection": dict(Counter(r.get("collection", "Uncategorized") for r in matched).most_common()),
+        "by_type": dict(Counter(r.get("type", "other") for r in matched).most_common()),
+        "ids": [r.get("id") for r in matched],
+        "top_documents": top_documents
+    }
+
+
+def generate_postings(records: List[Dict], persons: Dict, output_dir: Path = POSTINGS_DIR,
+                      top: int = TOP_DOCUMENTS) -> Dict[str, Dict]:
+    """Write per-person posting files plus index.json; returns the index."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tag_index = build_tag_index(records)
+    person_tags = {tag for tags in PERSON_ALIASES.values() for tag in tags}
+
+    index = {}
+    for name in get_person_names(persons):
+        positions = sorted({i for tag in PERSON_ALIASES.get(name, []) for i in tag_index.get(tag, [])})
+        if not positions:
+            continue
+        posting = build_posting(name, positions, records, person_tags, top)
+        with open(output_dir / f"{posting['slug']}.json", 'w', encoding='utf-8') as f:
+            json.dump(posting, f)
+        index[name] = {"slug": posting["slug"], "count": posting["count"]}
+
+    # Drop postings for people no longer matched
+    keep = {entry["slug"] for entry in index.values()} | {"index"}
+    for stale in output_dir.glob("*.json"):
+        if stale.stem not in keep:
+            stale.unlink()
+
+    with open(output_dir / "index.json", 'w', encoding='utf-8') as f:
+        json.dump({"generated": datetime.now().isoformat(), "persons": index}, f)
+
+    print(f"Generated {len(index)} person postings in {output_dir}")
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build per-person document postings")
+    parser.add_argument("--archive", type=Path, default=MASTER_FILE, help="master_archive.json to read")
+    parser.add_argument("--persons", type=Path, default=PERSONS_FILE, help="persons.json to read")
+    parser.add_argument("--output", type=Path, default=POSTINGS_DIR, help="Output directory for postings")
+    parser.add_argument("--top", type=int, default=TOP_DOCUMENTS, help="Top documents listed per person")
+    args = parser.parse_args()
+
+    print("Loading master archive...")
+    with open(args.archive, 'r', encoding='utf-8') as f:
+        records = json.load(f).get("records", [])
+    with open(args.persons, 'r', encoding='utf-8') as f:
+        persons = json.load(f)
+    print(f"Total records: {len(records)}")
+
+    generate_postings(records, persons, args.output, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Long-Running Indexer Daemon
+
+Loads the archive file set once and keeps it in memory, then accepts jobs
+over a local Unix socket so repeated operations run against warm state
+instead of re-importing dependencies and re-reading everything per CLI run.
+
+Protocol: one JSON object per line in, one JSON object per line out.
+
+    {"cmd": "rescan", "path": "/archive/USVI"}   re-walk a subtree (unchanged files are not re-hashed)
+    {"cmd": "retag", "path": "/archive/USVI"}    OCR person tags for PDFs (pdfplumber loaded on first use)
+    {"cmd": "reindex"}                           rewrite search-index.json and master_archive.json, cut a release
+    {"cmd": "flush", "thumbs": false}            run every output stage (see add_files.write_outputs)
+    {"cmd": "stats"}                             file counts, pending changes, job timings
+    {"cmd": "shutdown"}
+
+Usage:
+    python add_files.py daemon --scan /path/to/extracted /path/to/archive [--live]
+    python add_files.py ctl stats
+    python add_files.py ctl rescan /path/to/archive/subdir
+"""
+
+import os
+import json
+import time
+import socket
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import add_files
+
+SOCKET_PATH = add_files.DASHBOARD_DIR / ".indexer.sock"
+
+# Filesystem events are batched for this long before the state is updated and flushed
+LIVE_DEBOUNCE_SECONDS = 2.0
+
+# Watchdog event types that change the file set (opened/closed events are ignored)
+LIVE_EVENT_TYPES = {"created", "modified", "deleted", "moved"}
+
+# The daemon's own outputs; events under these would make every flush trigger the next
+LIVE_IGNORED_PATHS = [
+    str(add_files.DATA_DIR.absolute()),
+    str(add_files.THUMBS_DIR.absolute()),
+    str((add_files.DASHBOARD_DIR / "manifest.json").absolute()),
+]
+
+
+def _ocr_person_tags(path: str) -> List[str]:
+    """Worker entry point for retag; ocr_tagger (and pdfplumber) load only in workers."""
+    import ocr_tagger
+    return ocr_tagger.get_person_tags_from_text(ocr_tagger.extract_text_from_pdf(path))
+
+
+def _under(path: str, prefix: Optional[str]) -> bool:
+    return prefix is None or path == prefix or path.startswith(prefix.rstrip(os.sep) + os.sep)
+
+
+class IndexerState:
+    """Warm in-memory file set plus the job implementations that operate on it."""
+
+    def __init__(self, roots: List[Path], workers: Optional[int] = None, io_budget: Optional[int] = None):
+        # Not resolved: symlinked mounts must keep the archive/extracted parts get_path_info reads
+        self.roots = [Path(os.path.abspath(r)) for r in roots]
+        self.workers = workers
+        self.io_budget = io_budget
+        self.files: Dict[str, Dict] = {}
+        # Jobs mutate the file set on a worker thread while stats reads it on the event loop
+        self.files_lock = threading.Lock()
+        self.dirty = False
+        self.started = time.time()
+        self.jobs = Counter()
+        self.last_job: Dict[str, float] = {}
+
+    def ordered_files(self) -> List[Dict]:
+        with self.files_lock:
+            return [self.files[path] for path in sorted(self.files)]
+
+    def rescan(self, path: Optional[str] = None) -> Dict:
+        targets = [Path(os.path.abspath(path))] if path else self.roots
+        with self.files_lock:
+            cache = dict(self.files)
+        # Single files are re-extracted; vanished targets just drop their entries
+        found = []
+        dirs = [t for t in targets if t.is_dir()]
+        if dirs:
+            found = add_files.scan_roots(dirs, cache=cache, io_budget=self.io_budget)
+        found += [add_files.extract_metadata(t) for t in targets if t.is_file()]
+        with self.files_lock:
+            before = len(self.files)
+            for target in targets:
+                for stale in [p for p in self.files if _under(p, str(target))]:
+                    del self.files[stale]
+            for f in found:
+                self.files[f["path"]] = f
+            total = len(self.files)
+        self.dirty = True
+        return {"rescanned": len(found), "total": total, "delta": total - before}
+
+    def retag(self, path: Optional[str] = None) -> Dict:
+        pdfs = [f for f in self.ordered_files() if f["extension"] == ".pdf" and _under(f["path"], path)]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(_ocr_person_tags, [f["path"] for f in pdfs], chunksize=8)
+            tagged = 0
+            for f, tags in zip(pdfs, results):
+                f["ocr_tags"] = tags
+                tagged += bool(tags)
+        add_files.save_ocr_tags({add_files.get_path_info(f["path"])[2]: f["ocr_tags"] for f in pdfs})
+        self.dirty = True
+        return {"pdfs": len(pdfs), "tagged": tagged}
+
+    def reindex(self) -> Dict:
+        files = add_files.prepare_files(self.ordered_files(), thumbs=False, workers=self.workers)
+        add_files.generate_search_index(files)
+        add_files.generate_master_archive(files)
+        add_files.generate_release()
+        return {"records": len(files)}
+
+    def flush(self, thumbs: bool = True) -> Dict:
+        files = self.ordered_files()
+        add_files.write_outputs(files, thumbs=thumbs, workers=self.workers)
+        self.dirty = False
+        return {"records": len(files)}
+
+    def apply_changes(self, paths: List[str]) -> None:
+        """Fold filesystem events into the file set without walking the tree."""
+        updates = {}
+        for path in paths:
+            filepath = Path(path)
+            if add_files.EXCLUDE_DIRS.intersection(filepath.parts):
+                continue
+            try:
+                updates[path] = add_files.extract_metadata(filepath) if filepath.is_file() else None
+            except OSError:
+                updates[path] = None  # deleted between the event and the read
+        with self.files_lock:
+            for path, metadata in updates.items():
+                if metadata:
+                    self.files[path] = metadata
+                else:
+                    self.files.pop(path, None)
+        self.dirty = True
+
+    def stats(self) -> Dict:
+        with self.files_lock:
+            files = list(self.files.values())
+        return {
+            "roots": [str(r) for r in self.roots],
+            "files": len(files),
+            "by_category": dict(Counter(f["category"] for f in files)),
+            "dirty": self.dirty,
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "jobs": dict(self.jobs),
+            "last_job_seconds": self.last_job,
+        }
+
+
+class IndexerDaemon:
+    """Serves jobs on a Unix socket; jobs run one at a time off the event loop."""
+
+    def __init__(self, state: IndexerState, socket_path: Path = SOCKET_PATH, live: bool = False):
+        self.state = state
+        self.socket_path = socket_path
+        self.live = live
+        # Created in serve(): on Python 3.9 asyncio primitives bind to the loop current at creation
+        self.lock: Optional[asyncio.Lock] = None
+        self.stopping: Optional[asyncio.Event] = None
+        self.pending: set = set()
+        self.clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self.debounce: Optional[asyncio.TimerHandle] = None
+
+    async def run_job(self, name: str, func, *args) -> Dict:
+        async with self.lock:
+            started = time.perf_counter()
+            result = await asyncio.to_thread(func, *args)
+            elapsed = round(time.perf_counter() - started, 3)
+        self.state.jobs[name] += 1
+        self.state.last_job[name] = elapsed
+        return {"ok": True, "result": result, "elapsed": elapsed}
+
+    async def handle_job(self, job: Dict) -> Dict:
+        cmd = job.get("cmd")
+        if cmd == "stats":
+            return {"ok": True, "result": self.state.stats()}
+        if cmd == "shutdown":
+            self.stopping.set()
+            return {"ok": True, "result": "stopping"}
+        if cmd == "rescan":
+            return await self.run_job(cmd, self.state.rescan, job.get("path"))
+        if cmd == "retag":
+            return await self.run_job(cmd, self.state.retag, job.get("path"))
+        if cmd == "reindex":
+            return await self.run_job(cmd, self.state.reindex)
+        if cmd == "flush":
+            return await self.run_job(cmd, self.state.flush, job.get("thumbs", True))
+        return {"ok": False, "error": f"unknown cmd: {cmd!r}"}
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handle_job(json.loads(line))
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    async def close_clients(self) -> None:
+        """Closing a transport ends its pending readline, so handlers exit on their own."""
+        for writer in list(self.clients):
+            writer.close()
+        await asyncio.gather(*self.clients.values(), return_exceptions=True)
+
+    # -- live mode (watchdog) --------------------------------------------------
+
+    def dispatch(self, event) -> None:
+        """Watchdog handler hook; runs on the observer thread."""
+        if event.is_directory or event.event_type not in LIVE_EVENT_TYPES:
+            return
+        paths = [event.src_path] + ([event.dest_path] if getattr(event, "dest_path", None) else [])
+        paths = [p for p in paths if not any(_under(p, ignored) for ignored in LIVE_IGNORED_PATHS)]
+        if paths:
+            self.loop.call_soon_threadsafe(self.queue_changes, paths)
+
+    def queue_changes(self, paths: List[str]) -> None:
+        self.pending.update(paths)
+        if self.debounce:
+            self.debounce.cancel()
+        self.debounce = self.loop.call_later(
+            LIVE_DEBOUNCE_SECONDS, lambda: asyncio.ensure_future(self.flush_pending())
+        )
+
+    async def flush_pending(self) -> None:
+        paths, self.pending = sorted(self.pending), set()
+        try:
+            await self.run_job("live", self.state.apply_changes, paths)
+            await self.run_job("flush", self.state.flush)
+        except Exception as e:
+            # Nothing awaits this task, so requeue the batch rather than lose it
+            print(f"Live update failed ({e}); retrying {len(paths)} paths")
+            self.queue_changes(paths)
+            return
+        print(f"Live update: {len(paths)} changed paths flushed")
+
+    # -- lifecycle -------------------------------------------------------------
+
+    async def serve(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.lock = asyncio.Lock()
+        self.stopping = asyncio.Event()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        server = await asyncio.start_unix_server(self.handle_client, path=str(self.socket_path))
+
+        observer = None
+        if self.live:
+            from watchdog.observers import Observer
+            observer = Observer()
+            for root in self.state.roots:
+                observer.schedule(self, str(root), recursive=True)
+            observer.start()
+
+        print(f"Indexer ready: {len(self.state.files)} files, socket {self.socket_path}")
+        try:
+            async with server:
+                await self.stopping.wait()
+                await self.close_clients()
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+            self.socket_path.unlink(missing_ok=True)
+
+
+def run_daemon(roots: List[Path], socket_path: Path = SOCKET_PATH, live: bool = False,
+               workers: Optional[int] = None, io_budget: Optional[int] = None) -> None:
+    """Load state once, then serve jobs until shutdown or Ctrl+C."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: the indexer daemon needs Unix domain sockets (Linux/macOS/WSL)")
+        raise SystemExit(1)
+    if live and not add_files.WATCHDOG_AVAILABLE:
+        print("Error: watchdog library required for --live. Install with: pip install watchdog")
+        raise SystemExit(1)
+
+    state = IndexerState(roots, workers, io_budget)
+    started = time.perf_counter()
+    print(f"Loading {', '.join(str(r) for r in roots)}...")
+    state.rescan()
+    print(f"Loaded {len(state.files)} files in {time.perf_counter() - started:.2f}s")
+
+    try:
+        asyncio.run(IndexerDaemon(state, socket_path, live).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def send_job(job: Dict, socket_path: Path = SOCKET_PATH) -> Dict:
+    """Client side: send one job to a running daemon and wait for its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(job).encode() + b"\n")
+        with sock.makefile("rb") as reply:
+            return json.loads(reply.readline())
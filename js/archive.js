@@ -59,8 +59,8 @@ function renderCarousel() {
     carousel.innerHTML = featuredItems.map((item, idx) => `
         <div class="carousel-item" onclick="openModal('${item.path}', '${item.type}', '${item.name.replace(/'/g, "\\'")}')">
             <div class="carousel-item-preview">
-                ${item.type === 'image' ?
-            `<img src="${item.path}" alt="${item.name}" loading="lazy" onerror="this.parentElement.innerHTML='<div class=\\'type-icon\\'>🖼</div>'">` :
+                ${item.thumbnail || item.type === 'image' ?
+            `<img src="${item.thumbnail || item.path}" alt="${item.name}" loading="lazy" onerror="this.parentElement.innerHTML='<div class=\\'type-icon\\'>🖼</div>'">` :
             item.type === 'video' ?
                 `<div class="type-icon">🎬</div>` :
                 `<div class="type-icon">📄</div>`
@@ -269,9 +269,9 @@ function renderArchive() {
     container.innerHTML += pageItems.map(record => {
         // Determine the thumbnail/icon to show
         let thumbnailHtml = '';
-        if (record.type === 'image') {
+        if (record.thumbnail || record.type === 'image') {
             thumbnailHtml = `<div class="archive-item-preview">
-                <img src="${record.path}" alt="${record.name}" loading="lazy" onerror="this.parentElement.innerHTML='<div class=\\'archive-item-icon\\'>🖼</div>'">
+                <img src="${record.thumbnail || record.path}" alt="${record.name}" loading="lazy" onerror="this.parentElement.innerHTML='<div class=\\'archive-item-icon\\'>🖼</div>'">
             </div>`;
         } else if (record.type === 'video') {
             thumbnailHtml = `<div class="archive-item-icon video">🎬</div>`;
@@ -42,7 +42,8 @@ document.addEventListener('DOMContentLoaded', async () => {
                     filename: r.name,
                     relative_path: r.path,
                     collection_name: r.collection,
-                    file_type: r.type
+                    file_type: r.type,
+                    thumbnail: r.thumbnail
                 }));
                 renderFolders();
             } catch (e) {
@@ -180,17 +181,17 @@ document.addEventListener('DOMContentLoaded', async () => {
             const isVideo = item.filename.endsWith('.mp4') || item.file_type === 'video';
             const isPdf = item.filename.endsWith('.pdf') || item.file_type === 'document';
 
-            // Determine Thumbnail
-            let thumb = item.relative_path;
+            // Determine Thumbnail (prefer the small build-time derivative over the S3 original)
+            let thumb = item.thumbnail || item.relative_path;
             let typeLabel = 'IMAGE';
             let typeIcon = '';
 
             if (isVideo) {
-                thumb = 'https://placehold.co/400x225/12121a/fff?text=VIDEO+PLAYER';
+                thumb = item.thumbnail || 'https://placehold.co/400x225/12121a/fff?text=VIDEO+PLAYER';
                 typeLabel = 'VIDEO';
                 typeIcon = '<div style="position: absolute; inset: 0; display: flex; align-items: center; justify-content: center; font-size: 2rem; color: #fff; background: rgba(0,0,0,0.3);">▶</div>';
             } else if (isPdf) {
-                thumb = 'https://placehold.co/400x225/2a1212/fff?text=PDF+DOCUMENT';
+                thumb = item.thumbnail || 'https://placehold.co/400x225/2a1212/fff?text=PDF+DOCUMENT';
                 typeLabel = 'PDF';
             }
 
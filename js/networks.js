@@ -90,6 +90,17 @@ function renderFigures(figures) {
                         ${fig.connections.map(c => {
             const connected = networkData.key_figures.find(f => f.id === c);
             return connected ? `<span class="connection-chip">${connected.name.split(' ')[0]}</span>` : '';
+        }).join('')}
+                    </div>
+                ` : ''}
+
+                ${fig.cooccurrence && fig.cooccurrence.length > 0 ? `
+                    <div class="connections">
+                        <span class="connections-label">Appears in documents with:</span>
+                        ${fig.cooccurrence.slice(0, 5).map(edge => {
+            const connected = networkData.key_figures.find(f => f.id === edge.id);
+            const label = connected ? connected.name.split(' ')[0] : edge.id;
+            return `<span class="connection-chip" title="${edge.evidence.join(', ')}">${label} (${edge.count})</span>`;
         }).join('')}
                     </div>
                 ` : ''}
@@ -4,6 +4,8 @@
 let allPersons = [];
 let contactBook = [];
 let sourceDocuments = {};
+let postingsIndex = {};
+const postingsCache = {};
 
 document.addEventListener('DOMContentLoaded', async () => {
     try {
@@ -14,6 +16,14 @@ document.addEventListener('DOMContentLoaded', async () => {
         contactBook = data.contact_book_names || [];
         sourceDocuments = data.source_documents || {};
 
+        // Per-person document postings are optional build output (build_postings.py)
+        try {
+            const postingsResponse = await fetch('data/persons/index.json');
+            if (postingsResponse.ok) postingsIndex = (await postingsResponse.json()).persons || {};
+        } catch (e) {
+            postingsIndex = {};
+        }
+
         renderPersons(allPersons);
         renderContactBook(contactBook);
         setupFilters();
@@ -45,6 +55,49 @@ function renderSourceLinks(sources) {
     return links ? `<div class="person-sources">${links}</div>` : '';
 }
 
+// Contact book lists 'Last, First'; postings are keyed by 'First Last'
+function canonicalName(name) {
+    const parts = name.split(',');
+    return parts.length > 1 ? `${parts.slice(1).join(',').trim()} ${parts[0].trim()}` : name.trim();
+}
+
+function renderDocumentsLink(name) {
+    const entry = postingsIndex[canonicalName(name)];
+    if (!entry) return '';
+    return `
+        <a href="#" class="source-link" onclick="event.preventDefault(); showPersonDocuments('${entry.slug}', this);">${entry.count} archive docs</a>
+        <div class="person-documents"></div>
+    `;
+}
+
+async function showPersonDocuments(slug, link) {
+    const target = link.nextElementSibling;
+    if (target.innerHTML) {
+        target.innerHTML = '';
+        return;
+    }
+
+    try {
+        if (!postingsCache[slug]) {
+            const response = await fetch(`data/persons/${slug}.json`);
+            postingsCache[slug] = await response.json();
+        }
+        const posting = postingsCache[slug];
+        const collections = Object.entries(posting.by_collection).slice(0, 3)
+            .map(([col, count]) => `${col} (${count})`).join(', ');
+
+        target.innerHTML = `
+            <span class="notes">${collections}</span>
+            <ul class="key-facts">
+                ${posting.top_documents.map(doc => `<li><a href="${doc.path}" target="_blank">${doc.id}</a> ${doc.name}</li>`).join('')}
+            </ul>
+            ${posting.count > posting.top_documents.length ? `<a href="archive.html?q=${encodeURIComponent(posting.tags[0] || posting.name)}" class="source-link">View all ${posting.count} in archive</a>` : ''}
+        `;
+    } catch (error) {
+        console.error('Error loading person documents:', error);
+    }
+}
+
 function renderPersons(persons) {
     const grid = document.getElementById('personsList');
     if (!grid) return;
@@ -56,6 +109,7 @@ function renderPersons(persons) {
                 <span class="role">${p.role || ''}</span>
                 ${p.notes ? `<span class="notes">${p.notes}</span>` : ''}
                 ${renderSourceLinks(p.sources)}
+                ${renderDocumentsLink(p.name)}
             </div>
             <span class="mentions">${p.mentions || 0}</span>
         </div>
@@ -94,6 +148,7 @@ function renderContactBook(names, page = 1) {
     // However, user asked for a "Grid".
 
     const htmlMap = pageItems.map(name => {
+        const entry = postingsIndex[canonicalName(name)];
         return `
             <div class="contact-pill" style="
                 background: rgba(255,255,255,0.03); 
@@ -108,7 +163,7 @@ function renderContactBook(names, page = 1) {
                 align-items: center;
             ">
                 <span>${name}</span>
-                <span style="font-size: 0.7rem; opacity: 0.5;">ENTRY</span>
+                <span style="font-size: 0.7rem; opacity: 0.5;">${entry ? `${entry.count} DOCS` : 'ENTRY'}</span>
             </div>
         `;
     }).join('');
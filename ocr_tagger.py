@@ -10,12 +10,12 @@ import os
 import re
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import pdfplumber
 
 # Paths
 DATA_DIR = Path("d:/Development/Projects/EpsteinInvestigation/dashboard/data")
 MASTER_FILE = DATA_DIR / "master_archive.json"
 SEARCH_FILE = DATA_DIR / "search-index.json"
+OCR_FILE = DATA_DIR / "ocr_tags.json"  # read back by add_files.py so rescans keep OCR tags
 
 # Person name patterns to search for (lowercase)
 PERSON_PATTERNS = {
@@ -38,6 +38,7 @@ PDF_SEARCH_PATHS = [
 
 def extract_text_from_pdf(pdf_path: str, max_pages: int = 10) -> str:
     """Extract text from first N pages of a PDF."""
+    import pdfplumber  # imported on first use so callers that never OCR stay fast
     try:
         text = ""
         with pdfplumber.open(pdf_path) as pdf:
@@ -78,7 +79,7 @@ def get_person_tags_from_text(text: str) -> list:
     
     return tags
 
-def process_single_record(record: dict) -> dict:
+def process_single_record(record: dict, ocr_hits: dict = None) -> dict:
     """Process a single record to add person tags from PDF content."""
     if record.get('type') != 'document':
         return record
@@ -100,6 +101,8 @@ def process_single_record(record: dict) -> dict:
         return record
     
     person_tags = get_person_tags_from_text(text)
+    if ocr_hits is not None:
+        ocr_hits[record['path']] = person_tags
     
     # Add new tags to existing tags
     existing_tags = set(record.get('tags', []))
@@ -122,12 +125,13 @@ def main():
     
     # Process in batches with progress
     processed = 0
+    ocr_hits = {}
     tagged_count = {tag: 0 for tag in PERSON_PATTERNS.keys()}
     
     print("\nProcessing PDFs...")
     for i, record in enumerate(records):
         if record.get('type') == 'document':
-            result = process_single_record(record)
+            result = process_single_record(record, ocr_hits)
             for tag in PERSON_PATTERNS.keys():
                 if tag in result.get('tags', []):
                     tagged_count[tag] += 1
@@ -141,6 +145,14 @@ def main():
     with open(MASTER_FILE, 'w', encoding='utf-8') as f:
         json.dump(data, f)
     
+    existing_hits = {}
+    if OCR_FILE.exists():
+        with open(OCR_FILE, 'r', encoding='utf-8') as f:
+            existing_hits = json.load(f)
+    existing_hits.update(ocr_hits)
+    with open(OCR_FILE, 'w', encoding='utf-8') as f:
+        json.dump(existing_hits, f)
+    
     # Rebuild search index
     search_index = [{
         "name": r["name"],
@@ -0,0 +1,185 @@
+"""
+Versioned Data Releases with Incremental Change Feeds
+
+Stamps each build of search-index.json, master_archive.json and
+manifest.json with a version, remembers every record's fingerprint, and
+writes a delta (records added / changed / removed) against the previous
+version. Returning visitors can fetch data/releases/latest.json and apply
+the deltas since their cached version instead of re-downloading everything.
+
+Output (data/releases/):
+    latest.json                  current version, file sizes, delta chain
+    delta-<from>-<to>.json       one change feed per version step
+    fingerprints.json            per-record fingerprints of the current version
+
+The next build diffs against fingerprints.json, so data/releases/ has to
+persist between builds (CI commits it with search-index.json). The
+search index stays a bare list for Fuse.js and carries no version field;
+latest.json, committed alongside it, names the version it belongs to.
+
+Usage:
+    python releases.py           # cut a release from the current outputs
+"""
+
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Paths
+DASHBOARD_DIR = Path(__file__).parent
+DATA_DIR = DASHBOARD_DIR / "data"
+RELEASES_DIR = DATA_DIR / "releases"
+
+# Versioned outputs: dashboard-relative path -> (records key or None for a bare list, identity field)
+RELEASE_FILES = {
+    "data/search-index.json": (None, "path"),
+    "data/master_archive.json": ("records", "path"),
+    "manifest.json": ("files", "relative_path"),
+}
+
+# Deltas older than this many versions are pruned; clients further behind do a full download
+MAX_DELTAS = 10
+
+
+def fingerprint(record: Dict) -> str:
+    """Stable short hash of a record's canonical JSON."""
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def load_records(path: Path, records_key: Optional[str]) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if records_key is None else data.get(records_key, [])
+
+
+def diff_records(records: List[Dict], id_field: str, previous: Dict[str, str]) -> Dict:
+    """Added/changed records and removed ids relative to previous fingerprints."""
+    current = {}
+    added, changed = [], []
+    for record in records:
+        key = record.get(id_field)
+        fp = fingerprint(record)
+        current[key] = fp
+        if key not in previous:
+            added.append(record)
+        elif previous[key] != fp:
+            changed.append(record)
+    removed = [key for key in previous if key not in current]
+    return {"added": added, "changed": changed, "removed": removed, "fingerprints": current}
+
+
+def stamp_version(path: Path, records_key: Optional[str], version: str) -> None:
+    """Embed the version in object-shaped outputs (bare lists are left as-is for Fuse.js)."""
+    if records_key is None:
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data["version"] = version
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+def publish_release(dashboard_dir: Path = DASHBOARD_DIR) -> Optional[Dict]:
+    """Cut a new version if any output changed; returns latest.json contents."""
+    releases_dir = dashboard_dir / "data" / "releases"
+    releases_dir.mkdir(parents=True, exist_ok=True)
+    fingerprints_path = releases_dir / "fingerprints.json"
+    latest_path = releases_dir / "latest.json"
+
+    previous = {"version": None, "files": {}}
+    if fingerprints_path.exists():
+        with open(fingerprints_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    latest = {"deltas": []}
+    if latest_path.exists():
+        with open(latest_path, 'r', encoding='utf-8') as f:
+            latest = json.load(f)
+
+    diffs = {}
+    for name, (records_key, id_field) in RELEASE_FILES.items():
+        path = dashboard_dir / name
+        if path.exists():
+            records = load_records(path, records_key)
+            diffs[name] = diff_records(records, id_field, previous["files"].get(name, {}))
+
+    changed = any(d["added"] or d["changed"] or d["removed"] for d in diffs.values())
+    if previous["version"] and not changed:
+        # The build just rewrote the outputs, so they need the current stamp back
+        for name, (records_key, _) in RELEASE_FILES.items():
+            if name in diffs:
+                stamp_version(dashboard_dir / name, records_key, previous["version"])
+        print(f"Release {previous['version']} unchanged, no delta written")
+        return latest
+
+    version = datetime.now().strftime("%Y%m%dT%H%M%S")
+    if previous["version"] and version <= previous["version"]:
+        # Two builds within one second still need distinct, ordered versions
+        base, _, n = previous["version"].partition(".")
+        version = f"{base}.{int(n or 0) + 1}"
+    for name, (records_key, _) in RELEASE_FILES.items():
+        if name in diffs:
+            stamp_version(dashboard_dir / name, records_key, version)
+
+    files = {}
+    for name, (_, id_field) in RELEASE_FILES.items():
+        if name in diffs:
+            files[name] = {
+                "bytes": (dashboard_dir / name).stat().st_size,
+                "records": len(diffs[name]["fingerprints"]),
+                "key": id_field,
+            }
+    full_bytes = sum(entry["bytes"] for entry in files.values())
+
+    deltas = latest.get("deltas", [])
+    if previous["version"]:
+        delta = {
+            "from": previous["version"],
+            "to": version,
+            "files": {
+                name: {k: d[k] for k in ("added", "changed", "removed")}
+                for name, d in diffs.items()
+            }
+        }
+        delta_path = releases_dir / f"delta-{previous['version']}-{version}.json"
+        with open(delta_path, 'w') as f:
+            json.dump(delta, f, separators=(",", ":"))
+        delta_bytes = delta_path.stat().st_size
+        deltas.append({
+            "from": previous["version"],
+            "to": version,
+            "path": delta_path.relative_to(dashboard_dir).as_posix(),
+            "bytes": delta_bytes,
+        })
+        counts = {k: sum(len(d[k]) for d in diffs.values()) for k in ("added", "changed", "removed")}
+        ratio = delta_bytes / full_bytes * 100 if full_bytes else 0.0
+        print(f"Delta {previous['version']} -> {version}: {counts['added']} added, "
+              f"{counts['changed']} changed, {counts['removed']} removed; "
+              f"{delta_bytes:,} bytes vs {full_bytes:,} full ({ratio:.2f}%)")
+
+    # Keep only the newest deltas and delete the files that fall off the chain
+    for old in deltas[:-MAX_DELTAS]:
+        (dashboard_dir / old["path"]).unlink(missing_ok=True)
+    deltas = deltas[-MAX_DELTAS:]
+
+    latest = {
+        "version": version,
+        "previous": previous["version"],
+        "generated": datetime.now().isoformat(),
+        "files": files,
+        "full_bytes": full_bytes,
+        "deltas": deltas,
+    }
+    with open(latest_path, 'w') as f:
+        json.dump(latest, f, indent=2)
+    with open(fingerprints_path, 'w') as f:
+        json.dump({"version": version, "files": {n: d["fingerprints"] for n, d in diffs.items()}}, f)
+
+    print(f"Published release {version} ({latest_path})")
+    return latest
+
+
+if __name__ == "__main__":
+    publish_release()
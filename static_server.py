@@ -0,0 +1,361 @@
+"""
+Local Static Server for the Dashboard
+
+A small asyncio HTTP/1.1 server for testing the dashboard the way a CDN
+serves it, instead of only through Vercel:
+
+- Precompressed `.br` / `.gz` sidecars are sent when the client accepts them
+- Strong ETags from content hashes, with 304 on If-None-Match
+- Single byte-range requests (206) for PDFs and videos, honouring If-Range
+- Keep-alive connections and zero-copy sendfile for bodies
+- Latency/throughput stats, printed periodically and served at /__stats
+
+Usage:
+    python add_files.py serve
+    python add_files.py serve --port 8080 --precompress --verbose
+
+Requirements:
+    pip install brotli   # optional, only for --precompress .br sidecars
+"""
+
+import re
+import json
+import gzip
+import time
+import asyncio
+import hashlib
+import mimetypes
+import traceback
+from collections import deque
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Sidecars are tried in this order when the client accepts the encoding
+SIDECAR_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+COMPRESSIBLE_EXTENSIONS = {".json", ".js", ".css", ".html", ".svg", ".txt", ".md"}
+PRECOMPRESS_MIN_BYTES = 1024
+
+STATS_PATH = "/__stats"
+STATS_INTERVAL = 10
+LATENCY_WINDOW = 10000
+KEEPALIVE_TIMEOUT = 15
+MAX_HEADER_BYTES = 64 * 1024
+
+REASONS = {
+    200: "OK", 206: "Partial Content", 304: "Not Modified", 400: "Bad Request",
+    404: "Not Found", 405: "Method Not Allowed", 416: "Range Not Satisfiable",
+    500: "Internal Server Error",
+}
+
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("application/json", ".json")
+
+
+class ServerStats:
+    """Request counters plus a sliding window of latencies for percentiles."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.by_status = {}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, status: int, sent: int, elapsed: float) -> None:
+        self.requests += 1
+        self.bytes_sent += sent
+        self.by_status[status] = self.by_status.get(status, 0) + 1
+        self.latencies.append(elapsed)
+
+    def snapshot(self) -> Dict:
+        uptime = time.perf_counter() - self.started
+        ordered = sorted(self.latencies)
+
+        def percentile(p):
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 3) if ordered else 0.0
+
+        return {
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "uptime_seconds": round(uptime, 1),
+            "requests_per_second": round(self.requests / uptime, 1) if uptime else 0.0,
+            "mb_per_second": round(self.bytes_sent / uptime / 1_000_000, 2) if uptime else 0.0,
+            "latency_ms": {"p50": percentile(0.50), "p95": percentile(0.95), "p99": percentile(0.99)},
+            "by_status": self.by_status,
+        }
+
+
+class StaticServer:
+    """Serves one directory tree; one instance per `serve` invocation."""
+
+    def __init__(self, root: Path, verbose: bool = False):
+        self.root = root.resolve()
+        self.verbose = verbose
+        self.stats = ServerStats()
+        self._etags: Dict[Tuple[str, int, int], str] = {}
+
+    # -- file resolution -------------------------------------------------------
+
+    def resolve(self, url_path: str) -> Optional[Path]:
+        """Map a URL path to a file under root, refusing traversal outside it."""
+        try:
+            candidate = (self.root / unquote(url_path).lstrip("/")).resolve()
+            if candidate != self.root and self.root not in candidate.parents:
+                return None
+            if candidate.is_dir():
+                candidate = candidate / "index.html"
+            return candidate if candidate.is_file() else None
+        except (ValueError, OSError):
+            # Embedded NUL bytes, over-long names and the like are just not found
+            return None
+
+    def select_representation(self, path: Path, accept_encoding: str, ranged: bool) -> Tuple[Path, Optional[str]]:
+        """Pick a precompressed sidecar when accepted; ranges always use the identity file."""
+        if ranged:
+            return path, None
+        accepted = {token.split(";")[0].strip() for token in accept_encoding.split(",")}
+        for encoding, suffix in SIDECAR_ENCODINGS:
+            sidecar = path.with_name(path.name + suffix)
+            if encoding in accepted and sidecar.is_file() and sidecar.stat().st_mtime >= path.stat().st_mtime:
+                return sidecar, encoding
+        return path, None
+
+    async def get_etag(self, path: Path) -> str:
+        """Strong ETag from the content hash, cached until size/mtime change."""
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        etag = self._etags.get(key)
+        if etag is None:
+            etag = f'"{await asyncio.to_thread(_hash_file, path)}"'
+            self._etags[key] = etag
+        return etag
+
+    # -- connection handling ---------------------------------------------------
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                keep_alive = await self.handle_request(head, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, head: bytes, writer: asyncio.StreamWriter) -> bool:
+        """Serve one request; returns whether the connection stays open."""
+        started = time.perf_counter()
+        try:
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ", 2)
+        except ValueError:
+            await self.send_simple(writer, 400, keep_alive=False)
+            return False
+
+        headers = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+        url_path = urlsplit(target).path
+
+        try:
+            if method not in ("GET", "HEAD"):
+                status, sent = await self.send_simple(writer, 405, keep_alive, {"Allow": "GET, HEAD"})
+            elif url_path == STATS_PATH:
+                body = json.dumps(self.stats.snapshot()).encode()
+                status, sent = await self.send_simple(writer, 200, keep_alive, body=body, content_type="application/json")
+            else:
+                status, sent = await self.serve_file(writer, method, url_path, headers, keep_alive)
+        except ConnectionError:
+            raise
+        except Exception:
+            # Nothing has been written yet (body errors surface as ConnectionError)
+            traceback.print_exc()
+            keep_alive = False
+            status, sent = await self.send_simple(writer, 500, keep_alive)
+
+        elapsed = time.perf_counter() - started
+        self.stats.record(status, sent, elapsed)
+        if self.verbose:
+            print(f'"{method} {target}" {status} {sent} {elapsed * 1000:.2f}ms')
+        return keep_alive
+
+    async def serve_file(self, writer: asyncio.StreamWriter, method: str, url_path: str,
+                         headers: Dict[str, str], keep_alive: bool) -> Tuple[int, int]:
+        path = self.resolve(url_path)
+        if path is None:
+            return await self.send_simple(writer, 404, keep_alive)
+
+        range_header = headers.get("range")
+        representation, encoding = self.select_representation(path, headers.get("accept-encoding", ""), bool(range_header))
+        size = representation.stat().st_size
+        etag = await self.get_etag(representation)
+
+        response_headers = {
+            "Content-Type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "ETag": etag,
+            "Last-Modified": formatdate(path.stat().st_mtime, usegmt=True),
+            "Cache-Control": "no-cache",
+            "Accept-Ranges": "bytes",
+            "Vary": "Accept-Encoding",
+        }
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+
+        if etag in [tag.strip() for tag in headers.get("if-none-match", "").split(",")]:
+            return await self.send_simple(writer, 304, keep_alive, response_headers)
+
+        status, offset, length = 200, 0, size
+        if range_header and headers.get("if-range", etag) == etag:
+            byte_range = parse_range(range_header, size)
+            if byte_range == "unsatisfiable":
+                response_headers["Content-Range"] = f"bytes */{size}"
+                return await self.send_simple(writer, 416, keep_alive, response_headers)
+            if byte_range:
+                offset, end = byte_range
+                status, length = 206, end - offset + 1
+                response_headers["Content-Range"] = f"bytes {offset}-{end}/{size}"
+
+        response_headers["Content-Length"] = str(length)
+        self.write_head(writer, status, response_headers, keep_alive)
+        if method == "HEAD" or length == 0:
+            await writer.drain()
+            return status, 0
+
+        await writer.drain()
+        try:
+            with open(representation, "rb") as f:
+                await asyncio.get_running_loop().sendfile(writer.transport, f, offset, length)
+        except (OSError, ValueError) as e:
+            # Headers are already out, so the only honest signal left is closing the connection
+            raise ConnectionAbortedError(str(e)) from e
+        return status, length
+
+    # -- response helpers ------------------------------------------------------
+
+    def write_head(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str], keep_alive: bool) -> None:
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Date: {formatdate(usegmt=True)}", "Server: epstein-dashboard"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    async def send_simple(self, writer: asyncio.StreamWriter, status: int, keep_alive: bool,
+                          headers: Optional[Dict[str, str]] = None, body: bytes = b"",
+                          content_type: str = "text/plain; charset=utf-8") -> Tuple[int, int]:
+        headers = dict(headers or {})
+        if status not in (200, 206, 304):
+            body = body or f"{status} {REASONS[status]}\n".encode()
+        if status != 304:
+            headers["Content-Type"] = content_type
+            headers["Content-Length"] = str(len(body))
+            headers.pop("Content-Encoding", None)
+        self.write_head(writer, status, headers, keep_alive)
+        writer.write(body)
+        await writer.drain()
+        return status, len(body)
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.sha1()
+    with open(path, 'rb') as f:
+        buf = f.read(1 << 20)
+        while len(buf) > 0:
+            hasher.update(buf)
+            buf = f.read(1 << 20)
+    return hasher.hexdigest()[:20]
+
+
+def parse_range(header: str, size: int):
+    """Parse a single `bytes=` range into inclusive (start, end).
+
+    Returns None to fall back to a full 200 response (malformed or
+    multi-range requests) and "unsatisfiable" for ranges past EOF.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes":
+        return None
+    match = re.fullmatch(r"(\d*)-(\d*)", spec.strip(), re.ASCII)
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    start, end = match.groups()
+    if size == 0:
+        return "unsatisfiable"
+    if not start:
+        suffix = int(end)
+        if suffix == 0:
+            return "unsatisfiable"
+        return max(0, size - suffix), size - 1
+    first = int(start)
+    last = int(end) if end else size - 1
+    if first >= size or last < first:
+        return "unsatisfiable"
+    return first, min(last, size - 1)
+
+
+def precompress(root: Path) -> None:
+    """Write .gz (and .br when brotli is installed) sidecars for text assets."""
+    written = 0
+    for path in root.rglob("*"):
+        if path.suffix not in COMPRESSIBLE_EXTENSIONS or not path.is_file():
+            continue
+        if path.stat().st_size < PRECOMPRESS_MIN_BYTES:
+            continue
+        data = path.read_bytes()
+        sidecars = [(".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+        if BROTLI_AVAILABLE:
+            sidecars.append((".br", lambda d: brotli.compress(d, quality=11)))
+        for suffix, compress in sidecars:
+            sidecar = path.with_name(path.name + suffix)
+            if sidecar.exists() and sidecar.stat().st_mtime >= path.stat().st_mtime:
+                continue
+            sidecar.write_bytes(compress(data))
+            written += 1
+    print(f"Precompressed {written} sidecar files under {root}")
+
+
+async def _report_stats(server: StaticServer) -> None:
+    last = 0
+    while True:
+        await asyncio.sleep(STATS_INTERVAL)
+        if server.stats.requests != last:
+            last = server.stats.requests
+            print(f"Stats: {json.dumps(server.stats.snapshot())}")
+
+
+async def _serve(root: Path, host: str, port: int, verbose: bool) -> None:
+    server = StaticServer(root, verbose)
+    listener = await asyncio.start_server(server.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+    reporter = asyncio.create_task(_report_stats(server))
+    print(f"Serving {server.root} at http://{host}:{port}/ (stats at {STATS_PATH})")
+    print("Press Ctrl+C to stop...")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        reporter.cancel()
+        print(f"Final stats: {json.dumps(server.stats.snapshot())}")
+
+
+def serve(root: Path, host: str = "127.0.0.1", port: int = 8000, verbose: bool = False) -> None:
+    """Run the server until interrupted."""
+    try:
+        asyncio.run(_serve(root, host, port, verbose))
+    except KeyboardInterrupt:
+        pass